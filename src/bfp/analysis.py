@@ -1,62 +1,228 @@
-import bpy
-import math
-
 # Parameters
 # assumed sizes in bytes for primitive types
 SIZEOF_FLOAT = 4  # vertex coordinates, UVs, color components
 SIZEOF_INT = 4  # indices
 
+# Per-element sizes of mesh data, derived from the above
+_VERTEX_SIZE = 3 * SIZEOF_FLOAT  # Vertex coordinates (x, y, z)
+_EDGE_SIZE = 2 * SIZEOF_INT  # Edge data (connecting 2 vertex indices)
+# Loop data (vertex index, edge index per loop)
+# Loops are fundamental to how Blender stores per-face-vertex data
+_LOOP_SIZE = 2 * SIZEOF_INT
+_POLYGON_SIZE = 3 * SIZEOF_INT  # Polygon data (loop start, loop total, material index). Approx.
+_UV_SIZE = 2 * SIZEOF_FLOAT  # Each UV entry has 2 floats (u,v)
+_VERTEX_COLOR_SIZE = 4 * SIZEOF_FLOAT  # Each color entry has 4 floats (r,g,b,a) per loop vertex
+_NORMAL_SIZE = 3 * SIZEOF_FLOAT  # Assuming 3 floats per normal
+
+# Object types that can carry material slots and particle systems; for all others
+# (empties, cameras, lights, ...) those collections are skipped entirely.
+_GEOMETRY_OBJECT_TYPES = frozenset({
+    "MESH", "CURVE", "SURFACE", "META", "FONT", "GPENCIL", "GREASEPENCIL",
+    "CURVES", "POINTCLOUD", "VOLUME",
+})
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 def format_size(size_bytes):
     """Helper function to format bytes into KB, MB, GB"""
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
-    size_name = ("B", "KB", "MB", "GB", "TB")
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
-    return f"{s} {size_name[i]}"
+    # bit_length() picks the 1024-based unit without going through math.log
+    i = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_UNITS[i]}"
 
 
-def estimate_mesh_data_size(mesh):
-    """Estimates the size of various mesh components."""
-    size = 0
+def new_analysis_cache():
+    """Creates the per-file cache used to estimate each shared datablock only once.
+
+    Keys of the inner dicts are ``as_pointer()`` values of the respective datablocks.
+    Entries are filled on first use during the object walk, so material and image work
+    is proportional to the unique datablocks actually referenced, without a separate
+    pre-pass over ``bpy.data`` (which would also estimate unused materials).
+    """
+    return {
+        "meshes": {},
+        "curves": {},
+        "images": {},
+        "materials": {},
+        "node_trees": {},
+    }
+
 
-    # Vertex coordinates (x, y, z)
-    size += len(mesh.vertices) * 3 * SIZEOF_FLOAT
+def _mesh_element_counts(mesh):
+    """Returns ``(vertices, edges, loops, polygons)`` counts for a mesh."""
+    return len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons)
 
-    # Edge data (connecting 2 vertex indices)
-    size += len(mesh.edges) * 2 * SIZEOF_INT
 
-    # Loop data (vertex index, edge index per loop)
-    # Loops are fundamental to how Blender stores per-face-vertex data
-    size += len(mesh.loops) * 2 * SIZEOF_INT
+def estimate_mesh_data_size(mesh, cache=None, counts=None):
+    """Estimates the size of various mesh components.
 
-    # Polygon data (loop start, loop total, material index)
-    size += len(mesh.polygons) * 3 * SIZEOF_INT  # Approx.
+    :param mesh: The mesh datablock to estimate.
+    :param cache: Optional dict keyed by ``mesh.as_pointer()``. Only pass it for
+                  persistent meshes, never for temporary ones from ``to_mesh()``.
+    :param counts: Optional ``_mesh_element_counts(mesh)`` result the caller has
+                   already read, so the RNA collections are not walked twice.
+    """
+    if cache is not None:
+        key = mesh.as_pointer()
+        cached_size = cache.get(key)
+        if cached_size is not None:
+            return cached_size
+
+    # Read each element count once, then combine them in a single expression
+    if counts is None:
+        counts = _mesh_element_counts(mesh)
+    num_vertices, num_edges, num_loops, num_polygons = counts
+
+    size = (
+        num_vertices * _VERTEX_SIZE
+        + num_edges * _EDGE_SIZE
+        + num_loops * _LOOP_SIZE
+        + num_polygons * _POLYGON_SIZE
+    )
 
     # UV Layers
     for uv_layer in mesh.uv_layers:
-        size += (
-            len(uv_layer.data) * 2 * SIZEOF_FLOAT
-        )  # Each UV entry has 2 floats (u,v)
+        size += len(uv_layer.data) * _UV_SIZE
 
     # Vertex Color Layers
     for vc_layer in mesh.vertex_colors:
-        # Each color entry has 4 floats (r,g,b,a) per loop vertex
-        size += len(vc_layer.data) * 4 * SIZEOF_FLOAT
+        size += len(vc_layer.data) * _VERTEX_COLOR_SIZE
 
     # CustomData Layers (normals, etc.) - this is a simplification
     # Blender's customdata system is complex. This is a rough pass.
     # Often normals are stored per-loop.
     if mesh.has_custom_normals:
-        size += len(mesh.loops) * 3 * SIZEOF_FLOAT  # Assuming 3 floats per normal
+        size += num_loops * _NORMAL_SIZE
 
+    if cache is not None:
+        cache[key] = size
     return size
 
 
-def analyze_object(obj):
-    """Analyzes a single Blender object and returns its estimated data footprint as a dictionary."""
+def _raw_image_bytes(width, height, channels, bits_per_channel):
+    """Returns the raw (uncompressed) pixel buffer size in whole bytes."""
+    return (width * height * channels * bits_per_channel) >> 3
+
+
+def estimate_image(img, cache=None):
+    """Estimates the raw (uncompressed) size of an image and returns its info as a dictionary.
+
+    :param img: The image datablock to estimate.
+    :param cache: Optional dict keyed by ``img.as_pointer()``.
+    """
+    if cache is not None:
+        key = img.as_pointer()
+        cached_info = cache.get(key)
+        if cached_info is not None:
+            return cached_info
+
+    width, height = img.size[0], img.size[1]
+    raw_channels = img.channels
+    channels = raw_channels if raw_channels > 0 else 4
+    if width and height:
+        depth = img.depth
+        bits_per_channel = (
+            depth // raw_channels
+            if depth >= raw_channels and raw_channels > 0
+            else depth
+        )
+        if bits_per_channel == 0: bits_per_channel = 8
+
+        img_size = _raw_image_bytes(width, height, channels, bits_per_channel)
+    else:
+        # Generated/placeholder images and UDIM tiles can report a zero size; nothing to estimate.
+        bits_per_channel = 0
+        img_size = 0
+
+    packed_file = img.packed_file
+    img_info = {
+        "name": img.name,
+        "source": img.source,
+        "packed": bool(packed_file),
+        "packed_size_bytes": packed_file.size if packed_file else 0,
+        "filepath": img.filepath_from_user(),
+        "dimensions": [width, height],
+        "channels": channels,
+        "bit_depth_per_channel": bits_per_channel,
+        "estimated_raw_size_bytes": img_size,
+        "users": img.users,
+    }
+
+    if cache is not None:
+        cache[key] = img_info
+    return img_info
+
+
+def _tex_image_nodes(node_tree, cache=None):
+    """Returns the image texture nodes (with an image assigned) of a node tree.
+
+    :param cache: Optional dict keyed by ``node_tree.as_pointer()``.
+    """
+    if cache is not None:
+        key = node_tree.as_pointer()
+        tex_nodes = cache.get(key)
+        if tex_nodes is not None:
+            return tex_nodes
+
+    tex_nodes = [node for node in node_tree.nodes if node.type == "TEX_IMAGE" and node.image]
+
+    if cache is not None:
+        cache[key] = tex_nodes
+    return tex_nodes
+
+
+def estimate_material_textures(mat, cache=None, image_cache=None, node_tree_cache=None):
+    """Estimates the size of the image textures used by a material.
+
+    :param mat: The material datablock to estimate.
+    :param cache: Optional dict keyed by ``mat.as_pointer()``.
+    :param image_cache: Optional dict passed on to :func:`estimate_image`.
+    :param node_tree_cache: Optional dict of image texture nodes keyed by ``node_tree.as_pointer()``.
+    :return: A tuple ``(material_textures_size, textures_in_mat_list)``.
+    """
+    if cache is not None:
+        key = mat.as_pointer()
+        cached_result = cache.get(key)
+        if cached_result is not None:
+            return cached_result
+
+    material_textures_size = 0
+    textures_in_mat_list = []
+    if mat.use_nodes and mat.node_tree:
+        for node in _tex_image_nodes(mat.node_tree, node_tree_cache):
+            img_info = estimate_image(node.image, image_cache)
+            material_textures_size += img_info["estimated_raw_size_bytes"]
+            textures_in_mat_list.append(img_info)
+
+    result = (material_textures_size, textures_in_mat_list)
+    if cache is not None:
+        cache[key] = result
+    return result
+
+
+def _copy_texture_info(img_info):
+    """Copies a (possibly cached) texture dict so results never share objects.
+
+    Shared objects would otherwise show up as anchors/aliases in the YAML output.
+    """
+    tex = dict(img_info)
+    tex["dimensions"] = list(img_info["dimensions"])
+    return tex
+
+
+def analyze_object(obj, depsgraph, cache=None):
+    """Analyzes a single Blender object and returns its estimated data footprint as a dictionary.
+
+    :param obj: The Blender object to analyze.
+    :param depsgraph: The evaluated dependency graph, fetched once per file by the caller.
+    :param cache: Optional cache from :func:`new_analysis_cache`, shared across the objects of a file
+                  so that shared meshes, curves, images and materials are estimated only once.
+    """
+    if cache is None:
+        cache = new_analysis_cache()
+
     obj_data = {
         "name": obj.name,
         "type": obj.type,
@@ -68,15 +234,20 @@ def analyze_object(obj):
         "particle_systems": [],
     }
 
-    total_object_estimated_size = 0
+    # Partial sizes per section, combined once at the end
+    mesh_size = 0
+    curve_size = 0
+    object_textures_total_size = 0
+    object_particles_total_size = 0
 
     if obj.type == "MESH":
         mesh = obj.data
+        mesh_counts = _mesh_element_counts(mesh)
         mesh_info = {
             "name": mesh.name,
-            "vertices": len(mesh.vertices),
-            "edges": len(mesh.edges),
-            "polygons": len(mesh.polygons),
+            "vertices": mesh_counts[0],
+            "edges": mesh_counts[1],
+            "polygons": mesh_counts[3],
             "uv_layers": len(mesh.uv_layers),
             "vertex_colors": len(mesh.vertex_colors),
             "users": mesh.users,
@@ -85,9 +256,11 @@ def analyze_object(obj):
             "evaluated_mesh": None,
         }
 
-        mesh_data_original_size = estimate_mesh_data_size(mesh)
+        mesh_data_original_size = estimate_mesh_data_size(
+            mesh, cache["meshes"], counts=mesh_counts
+        )
         mesh_info["estimated_size_bytes"] = mesh_data_original_size
-        total_object_estimated_size += mesh_data_original_size
+        mesh_size = mesh_data_original_size
 
         if obj.modifiers:
             for mod in obj.modifiers:
@@ -102,50 +275,66 @@ def analyze_object(obj):
             "error": None,
         }
         mesh_data_evaluated_size = 0
-        try:
-            depsgraph = bpy.context.evaluated_depsgraph_get()
-            eval_obj = obj.evaluated_get(depsgraph)
-            eval_mesh = eval_obj.to_mesh(
-                preserve_all_data_layers=True, depsgraph=depsgraph
-            )
-            if eval_mesh:
-                eval_mesh_data["vertices"] = len(eval_mesh.vertices)
-                eval_mesh_data["polygons"] = len(eval_mesh.polygons)
-                mesh_data_evaluated_size = estimate_mesh_data_size(eval_mesh)
-                eval_mesh_data["estimated_size_bytes"] = mesh_data_evaluated_size
-                eval_obj.to_mesh_clear()
-            else:
-                eval_mesh_data["error"] = "Could not convert evaluated object to mesh"
-        except Exception as e:
-            eval_mesh_data["error"] = str(e)
-            mesh_data_evaluated_size = mesh_data_original_size # Fallback
+        if obj.modifiers and any(mod.show_viewport for mod in obj.modifiers):
+            try:
+                eval_obj = obj.evaluated_get(depsgraph)
+                eval_mesh = eval_obj.to_mesh(
+                    preserve_all_data_layers=True, depsgraph=depsgraph
+                )
+                if eval_mesh:
+                    eval_counts = _mesh_element_counts(eval_mesh)
+                    eval_mesh_data["vertices"] = eval_counts[0]
+                    eval_mesh_data["polygons"] = eval_counts[3]
+                    mesh_data_evaluated_size = estimate_mesh_data_size(
+                        eval_mesh, counts=eval_counts
+                    )
+                    eval_mesh_data["estimated_size_bytes"] = mesh_data_evaluated_size
+                    eval_obj.to_mesh_clear()
+                else:
+                    eval_mesh_data["error"] = "Could not convert evaluated object to mesh"
+            except Exception as e:
+                eval_mesh_data["error"] = str(e)
+                mesh_data_evaluated_size = mesh_data_original_size # Fallback
+        else:
+            # No active modifiers: the evaluated mesh is identical to the original,
+            # so skip the expensive to_mesh() copy.
+            eval_mesh_data["vertices"] = mesh_info["vertices"]
+            eval_mesh_data["polygons"] = mesh_info["polygons"]
+            mesh_data_evaluated_size = mesh_data_original_size
+            eval_mesh_data["estimated_size_bytes"] = mesh_data_evaluated_size
 
         mesh_info["evaluated_mesh"] = eval_mesh_data
         obj_data["mesh_data"] = mesh_info
 
     elif obj.type == "CURVE":
         curve = obj.data
-        num_points = sum(
-            len(spline.points) for spline in curve.splines if hasattr(spline, "points")
-        )
-        num_bezier_points = sum(
-            len(spline.bezier_points)
-            for spline in curve.splines
-            if hasattr(spline, "bezier_points")
-        )
-        curve_data_size = (num_points * 3 * SIZEOF_FLOAT) + (
-            num_bezier_points * 9 * SIZEOF_FLOAT
-        )
-        total_object_estimated_size += curve_data_size
-
-        obj_data["curve_data"] = {
-            "name": curve.name,
-            "splines": len(curve.splines),
-            "total_points_poly_nurbs": num_points if num_points > 0 else 0,
-            "total_bezier_points": num_bezier_points if num_bezier_points > 0 else 0,
-            "estimated_size_bytes": curve_data_size,
-            "users": curve.users,
-        }
+        curve_key = curve.as_pointer()
+        curve_info = cache["curves"].get(curve_key)
+        if curve_info is None:
+            # Single pass over the splines, dispatched on the spline type.
+            splines = curve.splines
+            num_points = 0
+            num_bezier_points = 0
+            for spline in splines:
+                if spline.type == "BEZIER":
+                    num_bezier_points += len(spline.bezier_points)
+                else:
+                    num_points += len(spline.points)
+            curve_data_size = (num_points * 3 * SIZEOF_FLOAT) + (
+                num_bezier_points * 9 * SIZEOF_FLOAT
+            )
+            curve_info = {
+                "name": curve.name,
+                "splines": len(splines),
+                "total_points_poly_nurbs": num_points if num_points > 0 else 0,
+                "total_bezier_points": num_bezier_points if num_bezier_points > 0 else 0,
+                "estimated_size_bytes": curve_data_size,
+                "users": curve.users,
+            }
+            cache["curves"][curve_key] = curve_info
+
+        curve_size = curve_info["estimated_size_bytes"]
+        obj_data["curve_data"] = dict(curve_info)
 
     elif obj.type == "LIGHT":
         light = obj.data
@@ -157,10 +346,11 @@ def analyze_object(obj):
             "estimated_size_bytes": 0
         }
 
+    has_geometry = obj.type in _GEOMETRY_OBJECT_TYPES
+
     # Materials and Textures
-    if obj.material_slots:
+    if has_geometry and obj.material_slots:
         materials_list = []
-        object_textures_total_size = 0
         for slot_index, slot in enumerate(obj.material_slots):
             mat_data = {"slot_index": slot_index, "name": "Empty", "textures": [], "estimated_textures_size_bytes": 0, "users": 0}
             if slot.material:
@@ -168,49 +358,18 @@ def analyze_object(obj):
                 mat_data["name"] = mat.name
                 mat_data["users"] = mat.users
 
-                material_textures_size = 0
-                textures_in_mat_list = []
-                if mat.use_nodes and mat.node_tree:
-                    for node in mat.node_tree.nodes:
-                        if node.type == "TEX_IMAGE" and node.image:
-                            img = node.image
-                            channels = img.channels
-                            bits_per_channel = (
-                                img.depth // channels
-                                if img.depth >= channels and channels > 0
-                                else img.depth
-                            )
-                            if channels == 0: channels = 4
-                            if bits_per_channel == 0: bits_per_channel = 8
-
-                            img_size = (
-                                img.size[0] * img.size[1] * channels * (bits_per_channel / 8)
-                            )
-                            material_textures_size += img_size
-
-                            textures_in_mat_list.append({
-                                "name": img.name,
-                                "source": img.source,
-                                "packed": bool(img.packed_file),
-                                "packed_size_bytes": img.packed_file.size if img.packed_file else 0,
-                                "filepath": img.filepath_from_user(),
-                                "dimensions": [img.size[0], img.size[1]],
-                                "channels": channels,
-                                "bit_depth_per_channel": bits_per_channel,
-                                "estimated_raw_size_bytes": img_size,
-                                "users": img.users,
-                            })
-                mat_data["textures"] = textures_in_mat_list
+                material_textures_size, textures_in_mat_list = estimate_material_textures(
+                    mat, cache["materials"], cache["images"], cache["node_trees"]
+                )
+                mat_data["textures"] = [_copy_texture_info(tex) for tex in textures_in_mat_list]
                 mat_data["estimated_textures_size_bytes"] = material_textures_size
                 object_textures_total_size += material_textures_size
             materials_list.append(mat_data)
         obj_data["materials"] = materials_list
-        total_object_estimated_size += object_textures_total_size
 
     # Particle Systems
-    if obj.particle_systems:
+    if has_geometry and obj.particle_systems:
         particle_systems_list = []
-        object_particles_total_size = 0
         for psys_idx, psys in enumerate(obj.particle_systems):
             settings = psys.settings
             particle_base_size = settings.count * (3 * SIZEOF_FLOAT)  # Position
@@ -228,22 +387,98 @@ def analyze_object(obj):
                 "settings_users": settings.users,
             })
         obj_data["particle_systems"] = particle_systems_list
-        total_object_estimated_size += object_particles_total_size
 
-    obj_data["total_estimated_size"] = total_object_estimated_size
+    obj_data["total_estimated_size"] = (
+        mesh_size + curve_size + object_textures_total_size + object_particles_total_size
+    )
     return obj_data
 
 
-def profile_blend_file(blend_file_path: str, analyze_all_scene_objects: bool = False):
+def render_object_report(obj_data, lines):
+    """Formats the result of :func:`analyze_object` as human-readable report lines.
+
+    Kept separate from the estimation so that callers only needing totals never pay for formatting.
+
+    :param obj_data: A dictionary as returned by :func:`analyze_object`.
+    :param lines: A list the formatted lines are appended to.
+    """
+    lines.append(
+        f"Object: {obj_data['name']} ({obj_data['type']}) - "
+        f"{format_size(obj_data['total_estimated_size'])}"
+    )
+
+    mesh_info = obj_data.get("mesh_data")
+    if mesh_info:
+        lines.append(
+            f"  Mesh: {mesh_info['name']} | {mesh_info['vertices']} verts, "
+            f"{mesh_info['polygons']} polys | {format_size(mesh_info['estimated_size_bytes'])} "
+            f"(users: {mesh_info['users']})"
+        )
+        for mod in mesh_info["modifiers"]:
+            viewport = "on" if mod["show_viewport"] else "off"
+            lines.append(f"    Modifier: {mod['name']} ({mod['type']}, viewport {viewport})")
+        eval_mesh_data = mesh_info.get("evaluated_mesh")
+        if eval_mesh_data:
+            if eval_mesh_data["error"]:
+                lines.append(f"    Evaluated: error: {eval_mesh_data['error']}")
+            else:
+                lines.append(
+                    f"    Evaluated: {eval_mesh_data['vertices']} verts, "
+                    f"{eval_mesh_data['polygons']} polys | "
+                    f"{format_size(eval_mesh_data['estimated_size_bytes'])}"
+                )
+
+    curve_info = obj_data.get("curve_data")
+    if curve_info:
+        lines.append(
+            f"  Curve: {curve_info['name']} | {curve_info['splines']} splines, "
+            f"{curve_info['total_points_poly_nurbs']} points, "
+            f"{curve_info['total_bezier_points']} bezier points | "
+            f"{format_size(curve_info['estimated_size_bytes'])} (users: {curve_info['users']})"
+        )
+
+    light_info = obj_data.get("light_data")
+    if light_info:
+        lines.append(f"  Light: {light_info['name']} ({light_info['type']}, energy {light_info['energy']})")
+
+    for mat_data in obj_data.get("materials", []):
+        lines.append(
+            f"  Material [{mat_data['slot_index']}]: {mat_data['name']} | textures "
+            f"{format_size(mat_data['estimated_textures_size_bytes'])} (users: {mat_data['users']})"
+        )
+        for tex in mat_data["textures"]:
+            width, height = tex["dimensions"]
+            packed = f", packed {format_size(tex['packed_size_bytes'])}" if tex["packed"] else ""
+            lines.append(
+                f"    Texture: {tex['name']} | {width}x{height}, {tex['channels']} ch, "
+                f"{tex['bit_depth_per_channel']} bit | "
+                f"{format_size(tex['estimated_raw_size_bytes'])} raw{packed}"
+            )
+
+    for psys_data in obj_data.get("particle_systems", []):
+        lines.append(
+            f"  Particles: {psys_data['name']} ({psys_data['type']}, {psys_data['count']}) | "
+            f"{format_size(psys_data['estimated_base_size_bytes'])}"
+        )
+
+
+def profile_blend_file(
+    blend_file_path: str, analyze_all_scene_objects: bool = False, include_hidden: bool = True
+):
     """
     Opens a .blend file and analyzes its objects, returning structured data.
 
     :param blend_file_path: Path to the .blend file.
     :param analyze_all_scene_objects: If True, analyzes all objects in bpy.data.objects.
                                       If False (default), analyzes objects in the current scene (bpy.context.scene.objects).
+    :param include_hidden: If False, skips objects disabled for rendering (``hide_render``),
+                           which matches the render-time footprint of the file.
     :return: A dictionary containing the analysis results or an error message.
     :raises RuntimeError: If the .blend file cannot be opened (re-raised).
     """
+    # Imported lazily so the estimation helpers (and format_size) work without Blender.
+    import bpy
+
     analysis_result = {
         "file_path": blend_file_path,
         "status": "success",
@@ -269,32 +504,40 @@ def profile_blend_file(blend_file_path: str, analyze_all_scene_objects: bool = F
         # It's better to let the caller handle the exception if it's critical
         raise
 
-    objects_to_analyze = []
+    # The bpy collections are iterated directly rather than copied into a list first.
+    objects_to_analyze = ()
     if analyze_all_scene_objects:
         analysis_result["analysis_scope"] = "all_data_objects"
-        objects_to_analyze = list(bpy.data.objects)
+        objects_to_analyze = bpy.data.objects
     else:
         if bpy.context.scene:
             analysis_result["scene_name"] = bpy.context.scene.name
             analysis_result["analysis_scope"] = f"scene_objects ({bpy.context.scene.name})"
-            objects_to_analyze = list(bpy.context.scene.objects)
+            objects_to_analyze = bpy.context.scene.objects
         else:
             analysis_result["status"] = "error"
             analysis_result["message"] = "No active scene found. Cannot analyze scene objects. " \
                                          "Consider using the option to analyze all objects."
             return analysis_result # Return early with error
 
+    if not include_hidden:
+        objects_to_analyze = [obj for obj in objects_to_analyze if not obj.hide_render]
+
     if not objects_to_analyze:
         analysis_result["message"] += " No objects found to analyze based on the criteria."
         # Not necessarily an error, could be an empty scene.
     else:
         analysis_result["message"] += f" Analyzing {len(objects_to_analyze)} object(s)."
-        collected_objects_data = []
-        total_size_sum = 0
-        for obj in objects_to_analyze:
-            obj_data = analyze_object(obj) # analyze_object now returns a dict
-            collected_objects_data.append(obj_data)
-            total_size_sum += obj_data.get("total_estimated_size", 0)
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        cache = new_analysis_cache()
+        # Objects are analyzed serially on purpose: bpy/RNA access is not thread-safe and
+        # holds the GIL, so a thread pool would add contention (and shared cache writes)
+        # without any speedup. The per-file cache is what removes the redundant work.
+        collected_objects_data = [
+            analyze_object(obj, depsgraph, cache) for obj in objects_to_analyze
+        ]
+        # Aggregate once over the size column instead of accumulating inside the loop
+        total_size_sum = sum(obj_data["total_estimated_size"] for obj_data in collected_objects_data)
 
         analysis_result["objects"] = collected_objects_data
         analysis_result["summary"]["total_objects_analyzed"] = len(collected_objects_data)
@@ -1,35 +1,53 @@
 import argparse
+import os
 import sys
 import json
 
-from bfp import analysis
-from bfp import serialization
-from bfp.visualization import visualize_sunburst
 
-
-def main():
+def _build_parser():
+    """Builds the argument parser of the bfp command."""
     parser = argparse.ArgumentParser(
         prog="bfp",
         description="BFP: Blender Filesize Profiler - Analyzes object data sizes in .blend files and can visualize results.",
         epilog="Examples:\n"
                "  bfp scene.blend\n"
                "  bfp scene.blend --all-objects --verbose --save results.yaml\n"
+               "  bfp scene.blend --report\n"
                "  bfp scene.blend --web\n"
-               "  bfp results.yaml (visualizes a previously saved analysis)\n",
+               "  bfp scene.blend --save results.msgpack\n"
+               "  bfp results.yaml (visualizes a previously saved analysis)\n"
+               "  bfp results.yaml --summary-only\n",
         formatter_class=argparse.RawTextHelpFormatter,
     )
 
     parser.add_argument(
-        "input_path", type=str, help="Path to the .blend file for analysis or .yaml file for visualization."
+        "input_path", type=str, help="Path to the .blend file for analysis or .yaml/.msgpack file for visualization."
     )
     parser.add_argument(
         "--all-objects",
         action="store_true",
         help="When analyzing a .blend file, analyze all objects (bpy.data.objects). Default is current scene.",
     )
+    parser.add_argument(
+        "--skip-hidden",
+        action="store_true",
+        help="When analyzing a .blend file, skip objects disabled for rendering.",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output."
     )
+    parser.add_argument(
+        "-r",
+        "--report",
+        action="store_true",
+        help="When analyzing a .blend file, print a per-object size breakdown.",
+    )
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="When the input is a saved analysis, print its summary instead of visualizing it.\n"
+             "Only the file header is read, which is much faster for large analyses.",
+    )
     parser.add_argument(
         "-w",
         "--web",
@@ -42,7 +60,13 @@ def main():
         type=str,
         default=None,
         metavar="FILEPATH",
-        help="Save analysis results (from .blend file) to a YAML file. Ignored if input is already YAML.",
+        help="Save analysis results (from .blend file) to a YAML file, or MessagePack if the path ends in .msgpack/.mpk. "
+             "Ignored if input is already a saved analysis.",
+    )
+    parser.add_argument(
+        "--durable",
+        action="store_true",
+        help="Fsync the file written by --save before it replaces the destination.",
     )
     parser.add_argument(
         "--version",
@@ -51,23 +75,44 @@ def main():
         help="Print bfp version.",
     )
 
+    return parser
+
+
+def main():
     if len(sys.argv) == 1:
-        parser.print_help(sys.stderr)
+        _PARSER.print_help(sys.stderr)
         sys.exit(1)
 
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
+
+    # Imported after argument parsing so --help/--version never pay for them.
+    # bpy (via analysis) and pandas/plotly (via visualization) are imported on first real use.
+    from bfp import analysis
+    from bfp import serialization
 
     analysis_data = None
-    input_is_yaml = args.input_path.lower().endswith((".yaml", ".yml"))
+    input_ext = os.path.splitext(args.input_path)[1].lower()
+    input_is_yaml = input_ext in serialization.YAML_EXTENSIONS
+    input_is_msgpack = input_ext in serialization.MSGPACK_EXTENSIONS
+
+    if (input_is_yaml or input_is_msgpack) and args.summary_only:
+        analysis_data = serialization.load_analysis_metadata(args.input_path)
+        if not analysis_data:  # serialization prints its own errors
+            sys.exit(1)
+        print_summary(analysis_data)
+        sys.exit(0)
 
-    if input_is_yaml:
+    if input_is_yaml or input_is_msgpack:
         if args.verbose:
-            print(f"[bfp] CLI: Input is YAML file: {args.input_path}. Proceeding to visualization.")
-        # Directly visualize if --web is implicitly true for YAML, or explicitly set
-        visualize_sunburst(args.input_path, verbose=args.verbose, is_filepath=True)
-        sys.exit(0) # visualize_sunburst now calls sys.exit, but good to be explicit.
+            file_kind = "YAML" if input_is_yaml else "MessagePack"
+            print(f"[bfp] CLI: Input is {file_kind} file: {args.input_path}. Proceeding to visualization.")
+        # Directly visualize if --web is implicitly true for saved analyses, or explicitly set
+        from bfp.visualization import visualize_sunburst
 
-    # If not YAML, it must be a .blend file for analysis
+        visualized = visualize_sunburst(args.input_path, verbose=args.verbose, is_filepath=True)
+        sys.exit(0 if visualized else 1)
+
+    # If not a saved analysis, it must be a .blend file for analysis
     if args.verbose:
         print("[bfp] CLI: Input is .blend file. Performing analysis.")
         print(f"[bfp] Analyzing file: {args.input_path}")
@@ -78,23 +123,25 @@ def main():
 
     try:
         analysis_data = analysis.profile_blend_file(
-            args.input_path, analyze_all_scene_objects=args.all_objects
+            args.input_path,
+            analyze_all_scene_objects=args.all_objects,
+            include_hidden=not args.skip_hidden,
         )
 
         if args.verbose:
             print("[bfp] Profiler finished. Raw analysis data:")
-            print(json.dumps(analysis_data, indent=2))
-        else:
+            if not stdout_is_devnull():  # Nobody will read it, skip building the JSON
+                write_json(analysis_data)
+
+        if args.report and analysis_data and analysis_data.get("status") == "success":
+            report_lines = []
+            for obj_data in analysis_data.get("objects", []):
+                analysis.render_object_report(obj_data, report_lines)
+            sys.stdout.write("\n".join(report_lines) + "\n")
+
+        if not args.verbose:
             if analysis_data and analysis_data.get("status") == "success":
-                summary = analysis_data.get("summary", {})
-                print(f"Analysis Summary for: {analysis_data.get('file_path')}")
-                print(f"  Scene: {analysis_data.get('scene_name', 'N/A')}")
-                print(f"  Scope: {analysis_data.get('analysis_scope', 'N/A')}")
-                print(f"  Objects Analyzed: {summary.get('total_objects_analyzed', 0)}")
-                total_size_bytes = summary.get('total_estimated_size_all_objects', 0)
-                print(f"  Total Estimated Size: {analysis.format_size(total_size_bytes)}")
-                if analysis_data.get("message"):
-                    print(f"  Status: {analysis_data.get('message')}")
+                print_summary(analysis_data)
             elif analysis_data:
                 print(f"Analysis failed: {analysis_data.get('message')}", file=sys.stderr)
 
@@ -113,17 +160,19 @@ def main():
         if args.verbose:
             print(f"[bfp] Serializing analysis results to: {args.save}")
         try:
-            serialization.serialize_to_yaml(analysis_data, args.save)
+            serialization.serialize_analysis(analysis_data, args.save, durable=args.durable)
         except Exception as e:
             print(f"  Error saving to file '{args.save}': {e}", file=sys.stderr)
     elif args.save and (not analysis_data or analysis_data.get("status") != "success"):
-        print(f"  Skipping YAML serialization due to analysis error or no data.", file=sys.stderr)
+        print(f"  Skipping serialization due to analysis error or no data.", file=sys.stderr)
 
     if args.web and analysis_data and analysis_data.get("status") == "success":
         if args.verbose:
             print("[bfp] CLI: --web flag is set. Visualizing analysis results.")
-        visualize_sunburst(analysis_data, verbose=args.verbose, is_filepath=False)
-        # visualize_sunburst calls sys.exit()
+        from bfp.visualization import visualize_sunburst
+
+        if not visualize_sunburst(analysis_data, verbose=args.verbose, is_filepath=False):
+            sys.exit(1)
 
     if args.verbose:
         print("[bfp] CLI finished.")
@@ -134,6 +183,55 @@ def main():
         sys.exit(0)
 
 
+def print_summary(analysis_data):
+    """Prints the top-level summary of an analysis (works on the full data or just its header)."""
+    from bfp.analysis import format_size
+
+    get = analysis_data.get
+    summary = get("summary", {})
+    status_msg = get("message")
+    # Collect the report lines and emit them with a single write.
+    lines = [
+        f"Analysis Summary for: {get('file_path')}",
+        f"  Scene: {get('scene_name', 'N/A')}",
+        f"  Scope: {get('analysis_scope', 'N/A')}",
+        f"  Objects Analyzed: {summary.get('total_objects_analyzed', 0)}",
+    ]
+    total_size_bytes = summary.get('total_estimated_size_all_objects', 0)
+    lines.append(f"  Total Estimated Size: {format_size(total_size_bytes)}")
+    if status_msg:
+        lines.append(f"  Status: {status_msg}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def stdout_is_devnull():
+    """Returns True if stdout is redirected to the null device."""
+    try:
+        stdout_stat = os.fstat(sys.stdout.fileno())
+        devnull_stat = os.stat(os.devnull)
+    except (AttributeError, OSError, ValueError):
+        return False  # e.g. stdout replaced by an object without a file descriptor
+    return (stdout_stat.st_dev, stdout_stat.st_ino) == (devnull_stat.st_dev, devnull_stat.st_ino)
+
+
+def write_json(data):
+    """Writes data to stdout as indented JSON, using the much faster orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or stdout_buffer is None:
+        print(json.dumps(data, indent=2))
+        return
+
+    sys.stdout.flush()  # Keep ordering with text already printed
+    stdout_buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    stdout_buffer.write(b"\n")
+    stdout_buffer.flush()
+
+
 def get_project_version():
     try:
         from . import __version__
@@ -143,5 +241,114 @@ def get_project_version():
         return "unknown"
 
 
+def _build_batch_parser():
+    """Builds the argument parser of the bfp-batch command."""
+    parser = argparse.ArgumentParser(
+        prog="bfp-batch",
+        description="BFP batch mode - Analyzes many .blend files in one process.\n"
+                    "Reads one .blend file path per line from stdin, so argument parsing and\n"
+                    "the bpy import are only paid once.",
+        epilog="Examples:\n"
+               "  find . -name '*.blend' | bfp-batch\n"
+               "  ls *.blend | bfp-batch --all-objects --save-dir results\n",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--all-objects",
+        action="store_true",
+        help="Analyze all objects (bpy.data.objects) of each file. Default is the current scene.",
+    )
+    parser.add_argument(
+        "--skip-hidden",
+        action="store_true",
+        help="Skip objects disabled for rendering.",
+    )
+    parser.add_argument(
+        "-s",
+        "--save-dir",
+        type=str,
+        default=None,
+        metavar="DIRPATH",
+        help="Save each analysis to <DIRPATH>/<blend file path>.yaml, mirroring the input path\n"
+             "relative to the current directory (absolute for files outside of it).",
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {get_project_version()}",
+        help="Print bfp version.",
+    )
+    return parser
+
+
+def _batch_output_path(save_dir, blend_file_path):
+    """
+    Returns the YAML path for a .blend file in batch mode. The input path relative to the current
+    directory is mirrored under `save_dir`, so files with the same name in different directories
+    do not overwrite each other. Files outside the current directory use their absolute path.
+    """
+    abs_path = os.path.abspath(blend_file_path)
+    try:
+        rel_path = os.path.relpath(abs_path)
+    except ValueError:  # Different drive on Windows
+        rel_path = os.pardir
+    if rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep):
+        rel_path = os.path.splitdrive(abs_path)[1].lstrip(os.sep)
+    return os.path.normpath(os.path.join(save_dir, os.path.splitext(rel_path)[0] + ".yaml"))
+
+
+def batch_main():
+    args = _build_batch_parser().parse_args()
+
+    from bfp import analysis
+    from bfp import serialization
+
+    if args.save_dir:
+        os.makedirs(args.save_dir, exist_ok=True)
+
+    failures = 0
+    saved_paths = set()
+    for line in sys.stdin:
+        blend_file_path = line.strip()
+        if not blend_file_path:
+            continue
+
+        output_path = None
+        if args.save_dir:
+            output_path = _batch_output_path(args.save_dir, blend_file_path)
+            if output_path in saved_paths:
+                print(f"  Error: '{blend_file_path}' would overwrite '{output_path}', skipping.", file=sys.stderr)
+                failures += 1
+                continue
+            saved_paths.add(output_path)
+
+        try:
+            analysis_data = analysis.profile_blend_file(
+                blend_file_path,
+                analyze_all_scene_objects=args.all_objects,
+                include_hidden=not args.skip_hidden,
+            )
+        except Exception as e:
+            print(f"  Error analyzing '{blend_file_path}': {e}", file=sys.stderr)
+            failures += 1
+            continue
+
+        if analysis_data.get("status") != "success":
+            print(f"Analysis failed: {analysis_data.get('message')}", file=sys.stderr)
+            failures += 1
+            continue
+
+        print_summary(analysis_data)
+        if output_path:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            if not serialization.serialize_to_yaml(analysis_data, output_path):
+                failures += 1
+
+    sys.exit(1 if failures else 0)
+
+
+_PARSER = _build_parser()
+
+
 if __name__ == "__main__":
     main()
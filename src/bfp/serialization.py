@@ -1,37 +1,339 @@
+import contextlib
+import hashlib
+import os
+import pickle
+import sys
+
 import yaml
 
-def serialize_to_yaml(data, output_path):
+try:
+    # libyaml-backed emitter/parser, much faster for large analyses
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# Large file buffer so multi-MB documents are written/read in few syscalls
+_IO_BUFFER_SIZE = 1024 * 1024
+
+YAML_EXTENSIONS = (".yaml", ".yml")
+MSGPACK_EXTENSIONS = (".msgpack", ".mpk")
+
+@contextlib.contextmanager
+def _atomic_write(output_path, mode, durable=False):
+    """
+    Opens a temporary file next to `output_path` and moves it into place with os.replace
+    once writing succeeded, so an interrupted write never leaves a truncated file behind.
+
+    :param durable: If True, fsync the file before it is moved into place.
+    """
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, mode, buffering=_IO_BUFFER_SIZE) as f:
+            yield f
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+def _cache_dir():
+    """Returns the directory for cached parse results (platformdirs is used if installed)."""
+    try:
+        from platformdirs import user_cache_dir
+
+        return user_cache_dir("bfp")
+    except ImportError:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(base, "bfp")
+
+def _yaml_cache_path(file_path):
+    """
+    Returns the pickle cache path for a YAML file. There is one entry per absolute path,
+    so re-saving a file replaces its entry instead of adding a new one.
+    """
+    key = os.path.abspath(file_path)
+    return os.path.join(_cache_dir(), hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pkl")
+
+def _read_cached_header(cache_path, st):
+    """
+    Returns the analysis header stored in a cache entry, or None if there is no entry or it was
+    written for a different version of the file (mtime or size changed).
+
+    :param st: The os.stat() result of the YAML file.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            mtime_ns, size, header = pickle.load(f)
+    except Exception:
+        return None  # Missing or unreadable cache entry
+    if (mtime_ns, size) != (st.st_mtime_ns, st.st_size):
+        return None
+    return header
+
+def _iter_cached_objects(cache_path):
+    """Yields the objects stored in a cache entry one at a time."""
+    with open(cache_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+        pickle.load(f)  # Header record, already read
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+def _iter_yaml_objects(file_path):
+    """Yields the object documents of an analysis YAML file one at a time, skipping the header."""
+    with open(file_path, 'r', buffering=_IO_BUFFER_SIZE) as f:
+        documents = yaml.load_all(f, Loader=SafeLoader)
+        next(documents, None)  # Header, already read
+        yield from documents
+
+def _iter_and_cache(objects, cache_path, st, header):
+    """
+    Yields `objects` while appending each one to a new cache entry (header record first, then
+    one pickle per object), so the cache is filled without holding all objects in memory.
+    The entry only replaces the previous one if all objects were read; caching is best effort.
+
+    :param st: The os.stat() result of the YAML file, taken before it was parsed.
+    """
+    tmp_path = f"{cache_path}.tmp"
+    cache_f = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        cache_f = open(tmp_path, 'wb', buffering=_IO_BUFFER_SIZE)
+        pickle.dump((st.st_mtime_ns, st.st_size, header), cache_f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        cache_f = _discard_cache_file(cache_f, tmp_path)
+
+    complete = False
+    try:
+        for obj in objects:
+            if cache_f is not None:
+                try:
+                    pickle.dump(obj, cache_f, protocol=pickle.HIGHEST_PROTOCOL)
+                except OSError:
+                    cache_f = _discard_cache_file(cache_f, tmp_path)
+            yield obj
+        complete = True
+    finally:
+        if cache_f is not None:
+            if complete:
+                with contextlib.suppress(OSError):
+                    cache_f.close()
+                    os.replace(tmp_path, cache_path)
+            else:
+                _discard_cache_file(cache_f, tmp_path)
+
+def _discard_cache_file(cache_f, tmp_path):
+    """Closes and removes a partially written cache entry. Always returns None."""
+    with contextlib.suppress(OSError):
+        if cache_f is not None:
+            cache_f.close()
+        os.remove(tmp_path)
+    return None
+
+def _open_yaml_analysis(file_path):
+    """
+    Shared loading logic of the YAML entry points.
+
+    Reads the analysis header (everything except the object list) and returns an iterator that
+    reads the objects lazily, one at a time: from the pickle cache if it is valid for the file
+    (one entry per path, checked against the file's mtime and size), otherwise from the YAML
+    stream, filling the cache while they are iterated. Errors are raised.
+
+    :return: A tuple ``(header, objects, cached)``. For files that do not contain an analysis
+             dictionary, `header` is the loaded data and `objects` is None.
+    """
+    st = os.stat(file_path)
+    cache_path = _yaml_cache_path(file_path)
+    header = _read_cached_header(cache_path, st)
+    if header is not None:
+        return header, _iter_cached_objects(cache_path), True
+
+    with open(file_path, 'r', buffering=_IO_BUFFER_SIZE) as f:
+        header = next(yaml.load_all(f, Loader=SafeLoader), None)
+    if not isinstance(header, dict):
+        return header, None, False
+
+    if "objects" in header:
+        # Single-document file from an older version: already parsed completely
+        objects = iter(header.pop("objects") or [])
+    else:
+        objects = _iter_yaml_objects(file_path)
+    return header, _iter_and_cache(objects, cache_path, st, header), False
+
+def _print_load_error(file_path, e):
+    """Prints the error message for a failed load of `file_path`."""
+    if isinstance(e, FileNotFoundError):
+        print(f"Error: File not found at {file_path}")
+    elif isinstance(e, yaml.YAMLError):
+        print(f"Error parsing YAML file {file_path}: {e}")
+    else:
+        print(f"An unexpected error occurred while loading {file_path}: {e}")
+
+def _iter_yaml_documents(data):
+    """
+    Splits an analysis dictionary into YAML documents: the header (everything except
+    the object list) first, then one document per object.
+    """
+    yield {key: value for key, value in data.items() if key != "objects"}
+    yield from data["objects"]
+
+def serialize_to_yaml(data, output_path, durable=False):
     """
     Serializes the given data to a YAML file.
 
+    Analysis dictionaries are written as a stream of documents (header, then one per object)
+    so that the emitter only holds a single object's representation in memory at a time.
+
     :param data: The data to serialize (should be a dictionary or list).
     :param output_path: The path to the output YAML file.
+    :param durable: If True, fsync the file before it replaces `output_path`.
+    :return: True if the file was written, False if an error occurred.
     """
     try:
-        with open(output_path, 'w') as f:
-            yaml.dump(data, f, indent=2, sort_keys=False)
+        with _atomic_write(output_path, 'w', durable) as f:
+            if isinstance(data, dict) and isinstance(data.get("objects"), list):
+                yaml.dump_all(
+                    _iter_yaml_documents(data), f, Dumper=SafeDumper, explicit_start=True,
+                    indent=2, sort_keys=False, default_flow_style=False,
+                )
+            else:
+                yaml.dump(data, f, Dumper=SafeDumper, indent=2, sort_keys=False, default_flow_style=False)
         print(f"Successfully serialized analysis to {output_path}")
+        return True
     except Exception as e:
-        print(f"Error serializing to YAML: {e}")
+        print(f"Error serializing to YAML: {e}", file=sys.stderr)
+        return False
 
 def load_from_yaml(file_path):
     """
     Loads data from a YAML file.
 
+    Parsed results are cached as pickles in the user cache directory (one entry per path,
+    validated against the file's mtime and size), so loading the same, unmodified file again
+    skips YAML parsing entirely.
+
     :param file_path: The path to the input YAML file.
     :return: The loaded data (typically a dictionary or list), or None if an error occurs.
     """
     try:
-        with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
-        print(f"Successfully loaded data from {file_path}")
-        return data
-    except FileNotFoundError:
-        print(f"Error: File not found at {file_path}")
+        data, objects, cached = _open_yaml_analysis(file_path)
+        if objects is not None:
+            data["objects"] = list(objects)
+    except Exception as e:
+        _print_load_error(file_path, e)
         return None
-    except yaml.YAMLError as e:
-        print(f"Error parsing YAML file {file_path}: {e}")
+    if data is None:
+        print(f"Error: No data found in {file_path}")
         return None
+    print(f"Successfully loaded data from {file_path}{' (cached)' if cached else ''}")
+    return data
+
+def load_metadata_from_yaml(file_path):
+    """
+    Loads only the header of an analysis YAML file (everything except the per-object data).
+
+    For files written by serialize_to_yaml only the first document is parsed, so this is
+    much faster than load_from_yaml for large analyses.
+
+    :param file_path: The path to the input YAML file.
+    :return: The header dictionary, or None if an error occurs.
+    """
+    try:
+        header, _, _ = _open_yaml_analysis(file_path)
     except Exception as e:
-        print(f"An unexpected error occurred while loading {file_path}: {e}")
+        _print_load_error(file_path, e)
+        return None
+    return header
+
+def load_analysis_stream_from_yaml(file_path):
+    """
+    Loads an analysis YAML file so that its objects can be consumed in a single pass.
+
+    Only the header is loaded up front; the objects are read one at a time while they are
+    iterated (from the cache if it is valid, see load_from_yaml), so the complete object
+    list is never held in memory.
+
+    :param file_path: The path to the input YAML file.
+    :return: A tuple ``(header, objects)`` where `objects` is an iterator, or ``(None, None)``
+             if an error occurs before the objects. Errors while iterating `objects` are raised.
+    """
+    try:
+        header, objects, cached = _open_yaml_analysis(file_path)
+    except Exception as e:
+        _print_load_error(file_path, e)
+        return None, None
+    if objects is None:
+        print(f"Error: {file_path} does not contain analysis data")
+        return None, None
+    print(f"Successfully opened {file_path}{' (cached)' if cached else ''}")
+    return header, objects
+
+def serialize_to_msgpack(data, output_path, durable=False):
+    """
+    Serializes the given data to a MessagePack file.
+    Binary and much faster to write and read back than YAML; requires the optional `msgpack` package.
+
+    :param data: The data to serialize (should be a dictionary or list).
+    :param output_path: The path to the output MessagePack file.
+    :param durable: If True, fsync the file before it replaces `output_path`.
+    :return: True if the file was written, False if an error occurred.
+    """
+    try:
+        import msgpack
+
+        with _atomic_write(output_path, 'wb', durable) as f:
+            msgpack.pack(data, f, use_bin_type=True)
+        print(f"Successfully serialized analysis to {output_path}")
+        return True
+    except Exception as e:
+        print(f"Error serializing to MessagePack: {e}", file=sys.stderr)
+        return False
+
+def load_from_msgpack(file_path):
+    """
+    Loads data from a MessagePack file.
+
+    :param file_path: The path to the input MessagePack file.
+    :return: The loaded data (typically a dictionary or list), or None if an error occurs.
+    """
+    try:
+        import msgpack
+
+        with open(file_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+            data = msgpack.unpack(f, raw=False)
+        print(f"Successfully loaded data from {file_path}")
+        return data
+    except Exception as e:
+        _print_load_error(file_path, e)
         return None
+
+def is_msgpack_path(path):
+    """Returns True if the path has a MessagePack extension."""
+    return path.lower().endswith(MSGPACK_EXTENSIONS)
+
+def serialize_analysis(data, output_path, durable=False):
+    """
+    Serializes the given data to MessagePack or YAML depending on the extension of `output_path`.
+    Paths without a MessagePack extension are written as YAML.
+
+    :return: True if the file was written, False if an error occurred.
+    """
+    if is_msgpack_path(output_path):
+        return serialize_to_msgpack(data, output_path, durable)
+    return serialize_to_yaml(data, output_path, durable)
+
+def load_analysis_metadata(file_path):
+    """
+    Loads only the header of a saved analysis (everything except the per-object data),
+    choosing the format from the extension of `file_path`.
+    """
+    if is_msgpack_path(file_path):
+        data = load_from_msgpack(file_path)
+        if isinstance(data, dict):
+            data.pop("objects", None)
+        return data
+    return load_metadata_from_yaml(file_path)
@@ -8,29 +8,44 @@ from bfp import serialization
 def visualize_sunburst(input_source, verbose=False, is_filepath=True):
     """
     Handles the sunburst visualization.
-    Can take a file path to a YAML file or a pre-loaded data dictionary.
+    Can take a file path to a YAML/MessagePack file or a pre-loaded data dictionary.
+
+    :return: True if the chart was shown, False if the analysis data could not be loaded.
     """
     data = None
+    objects_data = []
     source_name = ""
+    is_streamed = False  # objects_data is an iterator, only the header can be checked up front
 
     if is_filepath:
-        yaml_file_path = input_source
-        source_name = yaml_file_path
+        file_path = input_source
+        source_name = file_path
         if verbose:
-            print(f"[bfp] CLI: Visualizing sunburst from YAML file: {yaml_file_path}")
-        data = serialization.load_from_yaml(yaml_file_path)
-        if not data:  # serialization.load_from_yaml prints its own errors
-            # sys.exit(1)
-            pass
+            print(f"[bfp] CLI: Visualizing sunburst from file: {file_path}")
+        if serialization.is_msgpack_path(file_path):
+            data = serialization.load_from_msgpack(file_path)
+            if data:
+                objects_data = data.get("objects", [])
+        else:
+            # Only the header is loaded up front; objects are streamed while building the chart rows
+            data, objects_data = serialization.load_analysis_stream_from_yaml(file_path)
+            is_streamed = True
+        if not data:  # serialization prints its own errors
+            return False
     else:
         data = input_source  # input_source is the actual data dictionary
+        objects_data = data.get("objects", [])
         source_name = data.get("file_path", "loaded data")
         if verbose:
             print(
                 f"[bfp] CLI: Visualizing sunburst from pre-loaded data for: {source_name}"
             )
 
-    if not data or data.get("status") != "success" or not data.get("objects"):
+    if is_streamed:
+        has_objects = bool(data.get("summary", {}).get("total_objects_analyzed"))
+    else:
+        has_objects = bool(data.get("objects"))
+    if not data or data.get("status") != "success" or not has_objects:
         print(
             f"Error: Could not process valid analysis data from {source_name}",
             file=sys.stderr,
@@ -42,12 +57,6 @@ def visualize_sunburst(input_source, verbose=False, is_filepath=True):
         # sys.exit(1)
         pass
 
-    objects_data = data.get("objects", [])
-    if not objects_data:
-        print(f"No objects found in {source_name} to visualize.", file=sys.stderr)
-        # sys.exit(0)
-        pass
-
     scene_name = data.get("scene_name", f"Analysis: {source_name.split('/')[-1]}")
     # Prepare data for Plotly Sunburst: ids, labels, parents, values
     # Root: Scene Name
@@ -106,8 +115,8 @@ def visualize_sunburst(input_source, verbose=False, is_filepath=True):
     # New approach: Prepare data for Plotly Sunburst using path argument with explicit level columns
     # Levels: Scene -> Type -> Object Name
     df_data_list = []
-    if objects_data:  # Ensure objects_data is not empty before iterating
-        for obj in objects_data:
+    try:
+        for obj in objects_data:  # May be a generator streaming objects from file
             obj_name = obj.get("name", "Unnamed Object")
             obj_type = obj.get("type", "UNKNOWN_TYPE")
             obj_size = obj.get("total_estimated_size", 0)
@@ -117,10 +126,19 @@ def visualize_sunburst(input_source, verbose=False, is_filepath=True):
                 "name": obj_name,     # Column for the object name (leaf) level
                 "size": obj_size      # Column for the values
             })
+    except Exception as e:
+        # Don't draw a partial chart if the stream breaks off (e.g. a YAML error in a later object)
+        print(f"Error reading object data from {source_name}: {e}", file=sys.stderr)
+        return False
+
+    if not df_data_list:
+        print(f"No objects found in {source_name} to visualize.", file=sys.stderr)
+        # sys.exit(0)
+        pass
 
     # If df_data_list is empty, df will be empty.
     # Plotly Express generally handles empty dataframes by rendering an empty chart.
-    # The earlier check `if not objects_data:` already prints a message.
+    # The check above already prints a message.
     df = pd.DataFrame(df_data_list)
 
     # Create the sunburst figure using the new path approach
@@ -157,6 +175,7 @@ def visualize_sunburst(input_source, verbose=False, is_filepath=True):
     if verbose:
         print("[bfp] Sunburst visualization finished.")
     # sys.exit(0)
+    return True
 
 
 def test_visualize_from_yaml(yaml_file_path="results.yaml", verbose=True):